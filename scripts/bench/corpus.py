@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Synthetic docs and doc trees shared by every benchmark mode.
+
+Trees mirror the layout of public/docs: markdown under
+``orca-slicer/calibration`` and the image mirror under
+``orca-slicer/images``. Docs mix mapped remote images, unmapped ones, and
+the site-relative Obico assets and links the profile guide rules fix up.
+"""
+import os
+import random
+from collections import namedtuple
+
+from doc_links import derive_local_path, mirror_path
+
+BASE_URL = 'https://github.com/SoftFever/OrcaSlicer/raw/main/doc/images'
+SECTIONS = ['Flow-Rate', 'InputShaping', 'JunctionDeviation', 'pa', 'MVF', 'retraction']
+PROSE = 'Some prose about calibration settings and flow.\n'
+# Smallest valid GIF, so mirrored images exist without costing disk
+PIXEL = b'GIF89a\x01\x00\x01\x00\x00\x00\x00;'
+# Docs are generated as if they lived in orca-slicer/calibration
+DOC_PATH = os.path.join('orca-slicer', 'calibration', 'doc.md')
+
+Tree = namedtuple('Tree', ['root', 'docs_dir', 'images_root', 'files', 'mappings'])
+
+
+def build_mappings(count):
+    """A remote url -> ../images/... table of ``count`` entries"""
+    mappings = {}
+    for i in range(count):
+        url = f'{BASE_URL}/{SECTIONS[i % len(SECTIONS)]}/image-{i}.png?raw=true'
+        mappings[url] = derive_local_path(url, DOC_PATH)
+    # Keep the doubled query string quirk from the real table
+    if mappings:
+        first = next(iter(mappings))
+        mappings[first + '?raw=true'] = mappings[first]
+    return mappings
+
+
+def build_doc(index, urls, links_per_file, rng):
+    parts = [f'# Synthetic doc {index}\n\n']
+    for j in range(links_per_file):
+        parts.append(f'## Step {j}\n\n' + PROSE * 4 + '\n')
+        if j % 7 == 3:
+            parts.append(f'![shot](/assets/images/guide/shot-{index}-{j}-{rng.getrandbits(64):016x}.png)\n\n')
+        elif j % 7 == 5:
+            parts.append(f'See [the blog](/blog/post-{j}) for details.\n\n')
+        elif j % 5 == 4 or not urls:
+            # Remote image that is not in the table
+            parts.append(f'![unmapped]({BASE_URL}/other/missing-{index}-{j}.png?raw=true)\n\n')
+        else:
+            parts.append(f'![figure {j}]({rng.choice(urls)})\n\n')
+    return ''.join(parts)
+
+
+def build_docs(count, mappings, links_per_file, seed):
+    rng = random.Random(seed)
+    urls = list(mappings)
+    return [build_doc(index, urls, links_per_file, rng) for index in range(count)]
+
+
+def build_tree(root, files=200, links_per_file=20, mappings=1000, images=500, seed=1):
+    """Write a synthetic doc tree below ``root`` and describe it"""
+    docs_dir = os.path.join(root, 'orca-slicer', 'calibration')
+    images_root = os.path.join(root, 'orca-slicer', 'images')
+    os.makedirs(docs_dir, exist_ok=True)
+
+    table = build_mappings(mappings)
+    # Only the first ``images`` mapped urls have a mirrored file
+    for local_path in list(dict.fromkeys(table.values()))[:images]:
+        path = mirror_path(images_root, local_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(PIXEL)
+
+    filepaths = []
+    for index, doc in enumerate(build_docs(files, table, links_per_file, seed)):
+        filepath = os.path.join(docs_dir, f'doc-{index:05d}.md')
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(doc)
+        filepaths.append(filepath)
+    return Tree(root, docs_dir, images_root, filepaths, table)
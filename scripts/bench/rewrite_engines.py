@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Compare the per-mapping regex loop with the single-pass MappingRewriter.
+
+Builds docs from the shared synthetic corpus (corpus.py; 10k mappings, 1k
+docs by default), checks that both engines produce identical output and
+reports the timings. The regex loop is very slow at this size, so by
+default it only runs on a sample of the docs and its total time is
+extrapolated.
+
+With --memory it instead compares tracemalloc peaks of the in-memory and
+streaming file rewrites on documents of growing size.
+
+Usage: python3 scripts/bench/rewrite_engines.py [--mappings N] [--docs N] [--memory]
+"""
+import argparse
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# The doc_* libraries live one directory up
+sys.path.insert(1, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import PROSE, build_docs, build_mappings  # noqa: E402
+from doc_rewrite import MappingRewriter, rewrite_file  # noqa: E402
+
+
+def rewrite_with_regex_loop(content, mappings):
+    """The original update_markdown_file algorithm: one re.sub per mapping"""
+    for old_url, new_path in mappings.items():
+        escaped_url = re.escape(old_url)
+        pattern = f'!\\[([^\\]]*)\\]\\({escaped_url}\\)'
+        replacement = f'![\\1]({new_path})'
+        content = re.sub(pattern, replacement, content)
+    return content
+
+
+def measure_peak(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def build_large_docs(mappings, size_mb, seed):
+    """Yield ``(label, document)`` pairs of roughly ``size_mb`` MB"""
+    doc = build_docs(1, mappings, 1, seed)[0]
+    block = build_docs(1, mappings, 50, seed)[0]
+    yield 'links', doc + block * (size_mb * 1_000_000 // len(block) + 1)
+    # One '![' that never closes: everything after it is alt text
+    yield 'unclosed', doc + '![never closed\n' + PROSE * (size_mb * 1_000_000 // len(PROSE) + 1)
+
+
+def run_memory_benchmark(mappings, sizes_mb, seed):
+    """Rewrite single documents of growing size in memory and streamed"""
+    rewriter = MappingRewriter(mappings)
+    workdir = tempfile.mkdtemp(prefix='bench-rewrite-engines-')
+    try:
+        print(f"{'size':>8} {'document':>9} {'in-memory peak':>16} {'streaming peak':>16}  identical")
+        for size_mb in sizes_mb:
+            for label, doc in build_large_docs(mappings, size_mb, seed):
+                paths = {}
+                for mode in ('memory', 'stream'):
+                    paths[mode] = os.path.join(workdir, f'{mode}-{size_mb}.md')
+                    with open(paths[mode], 'w', encoding='utf-8') as f:
+                        f.write(doc)
+                del doc
+
+                memory_peak = measure_peak(lambda: rewrite_file(paths['memory'], rewriter))
+                stream_peak = measure_peak(lambda: rewrite_file(paths['stream'], rewriter, stream=True))
+                with open(paths['memory'], 'rb') as a, open(paths['stream'], 'rb') as b:
+                    identical = a.read() == b.read()
+                print(f"{size_mb:>6}MB {label:>9} {memory_peak / 1e6:>14.1f}MB "
+                      f"{stream_peak / 1e6:>14.2f}MB  {identical}")
+                if not identical:
+                    raise SystemExit(f"Streaming output differs for the {size_mb} MB {label} document")
+                for path in paths.values():
+                    os.unlink(path)
+    finally:
+        shutil.rmtree(workdir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--mappings', type=int, default=10_000)
+    parser.add_argument('--docs', type=int, default=1_000)
+    parser.add_argument('--links-per-file', type=int, default=20)
+    parser.add_argument('--legacy-sample', type=int, default=5,
+                        help='docs to run through the regex loop (0 = all)')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--memory', action='store_true',
+                        help='compare peak memory of in-memory and streaming rewrites')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 4, 16],
+                        help='document sizes in MB for --memory')
+    args = parser.parse_args()
+
+    mappings = build_mappings(args.mappings)
+    if args.memory:
+        run_memory_benchmark(mappings, args.sizes, args.seed)
+        return
+
+    docs = build_docs(args.docs, mappings, args.links_per_file, args.seed)
+    corpus_bytes = sum(len(doc) for doc in docs)
+    print(f"Corpus: {len(mappings)} mappings, {len(docs)} docs, {corpus_bytes / 1e6:.1f} MB")
+
+    t0 = time.perf_counter()
+    rewriter = MappingRewriter(mappings)
+    compile_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    fast_output = [rewriter.rewrite(doc) for doc in docs]
+    fast_time = time.perf_counter() - t0
+
+    sample = docs if args.legacy_sample <= 0 else docs[:args.legacy_sample]
+    t0 = time.perf_counter()
+    legacy_output = [rewrite_with_regex_loop(doc, mappings) for doc in sample]
+    legacy_sample_time = time.perf_counter() - t0
+    legacy_time = legacy_sample_time * len(docs) / len(sample)
+
+    mismatches = sum(1 for a, b in zip(fast_output, legacy_output) if a != b)
+    if mismatches:
+        raise SystemExit(f"Output mismatch in {mismatches} of {len(sample)} docs")
+
+    estimated = '' if len(sample) == len(docs) else f' (extrapolated from {len(sample)} docs)'
+    print(f"Single pass: {compile_time:.3f}s compile + {fast_time:.3f}s rewrite")
+    print(f"Regex loop:  {legacy_time:.3f}s{estimated}")
+    print(f"Speedup:     {legacy_time / (compile_time + fast_time):.0f}x")
+    print(f"Output identical on {len(sample)} docs")
+
+
+if __name__ == '__main__':
+    main()
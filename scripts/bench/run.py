@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Time the doc pipeline stages on a synthetic tree and compare with a baseline.
+
+Generates a doc tree of the requested size, runs every stage (see
+stages.py) several times and reports the median, min and max. Stages that
+rewrite files get a fresh copy of the tree before each run, outside the
+timed region.
+
+Results are written as JSON. When a baseline exists, each stage's median
+is compared with it and the run exits 1 if any stage got slower by more
+than --threshold percent. --profile also dumps a cProfile .pstats file and
+a tracemalloc snapshot per stage.
+
+    python3 scripts/bench/run.py --files 1000 --mappings 10000 --save-baseline
+    python3 scripts/bench/run.py --files 1000 --mappings 10000 --threshold 15
+    python3 scripts/bench/run.py --stages update_markdown_file --profile
+    python3 -m pstats .cache/bench/profile/update_markdown_file.pstats
+
+Two one-off comparisons live next to it and use the same corpus:
+rewrite_engines.py (regex loop vs MappingRewriter, and --memory for the
+streaming rewrite) and vector_search.py (the .npy vector store vs JSON
+embeddings).
+"""
+import argparse
+import cProfile
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# The doc_* libraries live one directory up
+sys.path.insert(1, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import build_tree  # noqa: E402
+from doc_rewrite import write_atomic  # noqa: E402
+from stages import STAGES  # noqa: E402
+
+BENCH_DIR = '.cache/bench'
+DEFAULT_OUT = f'{BENCH_DIR}/results.json'
+DEFAULT_BASELINE = f'{BENCH_DIR}/baseline.json'
+DEFAULT_PROFILE_DIR = f'{BENCH_DIR}/profile'
+
+
+def time_stage(stage, tree, restore, repeats, warmup):
+    timings = []
+    for i in range(warmup + repeats):
+        if stage.mutates:
+            restore()
+        started = time.perf_counter()
+        stage.run(tree)
+        elapsed = time.perf_counter() - started
+        if i >= warmup:
+            timings.append(elapsed)
+    return timings
+
+
+def profile_stage(stage, tree, restore, out_dir):
+    """One cProfile run and one tracemalloc run of ``stage``; return the artifacts"""
+    if stage.mutates:
+        restore()
+    profiler = cProfile.Profile()
+    profiler.runcall(stage.run, tree)
+    pstats_path = os.path.join(out_dir, f'{stage.name}.pstats')
+    profiler.dump_stats(pstats_path)
+
+    if stage.mutates:
+        restore()
+    tracemalloc.start(25)
+    try:
+        stage.run(tree)
+        snapshot = tracemalloc.take_snapshot()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    snapshot_path = os.path.join(out_dir, f'{stage.name}.tracemalloc')
+    snapshot.dump(snapshot_path)
+    return {'pstats': pstats_path, 'tracemalloc': snapshot_path, 'peak_bytes': peak}
+
+
+def compare(results, baseline, threshold):
+    """Annotate results with the change against baseline; return regressed stage names"""
+    if baseline['params'] != results['params']:
+        print(f"Warning: baseline was recorded with {baseline['params']}", file=sys.stderr)
+    regressions = []
+    for name, stage in results['stages'].items():
+        base = baseline['stages'].get(name)
+        if base is None:
+            continue
+        stage['baseline_median'] = base['median']
+        stage['change_pct'] = (stage['median'] / base['median'] - 1) * 100
+        if stage['change_pct'] > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def report(results, regressions):
+    width = max(len(name) for name in results['stages'])
+    print(f"{'stage':<{width}} {'median':>10} {'min':>10} {'max':>10} {'baseline':>10} {'change':>8}")
+    for name, stage in results['stages'].items():
+        line = (f"{name:<{width}} {stage['median'] * 1000:>8.1f}ms {stage['min'] * 1000:>8.1f}ms "
+                f"{stage['max'] * 1000:>8.1f}ms")
+        if 'baseline_median' in stage:
+            flag = '  REGRESSION' if name in regressions else ''
+            line += f" {stage['baseline_median'] * 1000:>8.1f}ms {stage['change_pct']:>+7.1f}%{flag}"
+        if 'peak_bytes' in stage:
+            line += f"  (peak {stage['peak_bytes'] / 1e6:.1f} MB)"
+        print(line)
+
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    write_atomic(path, json.dumps(data, indent=2) + '\n')
+
+
+def main():
+    names = [stage.name for stage in STAGES]
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--files', type=int, default=200, help='markdown files in the tree')
+    parser.add_argument('--links-per-file', type=int, default=20)
+    parser.add_argument('--mappings', type=int, default=1000, help='size of the image mapping table')
+    parser.add_argument('--images', type=int, default=500, help='mirrored image files on disk')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--warmup', type=int, default=1, help='untimed runs before the repeats')
+    parser.add_argument('--stages', nargs='+', choices=names, default=names, metavar='STAGE',
+                        help=f'stages to run (default: all of {", ".join(names)})')
+    parser.add_argument('--profile', nargs='?', const=DEFAULT_PROFILE_DIR, metavar='DIR',
+                        help=f'dump cProfile and tracemalloc data per stage (default: {DEFAULT_PROFILE_DIR})')
+    parser.add_argument('--out', default=DEFAULT_OUT, help=f'results JSON (default: {DEFAULT_OUT})')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help=f'baseline JSON to compare with (default: {DEFAULT_BASELINE})')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='store this run as the baseline instead of comparing')
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help='flag stages whose median is more than this %% slower (default: 10)')
+    args = parser.parse_args()
+
+    params = {'files': args.files, 'links_per_file': args.links_per_file,
+              'mappings': args.mappings, 'images': args.images, 'seed': args.seed}
+    results = {'params': params, 'repeats': args.repeats, 'python': platform.python_version(),
+               'machine': platform.machine(), 'cpus': os.cpu_count(), 'stages': {}}
+    if args.profile:
+        os.makedirs(args.profile, exist_ok=True)
+
+    workdir = tempfile.mkdtemp(prefix='bench-docs-')
+    try:
+        # Same seed, same tree: the pristine copy restores the work copy
+        pristine = build_tree(os.path.join(workdir, 'pristine'), **params)
+        tree = build_tree(os.path.join(workdir, 'work'), **params)
+
+        def restore():
+            shutil.rmtree(tree.docs_dir)
+            shutil.copytree(pristine.docs_dir, tree.docs_dir)
+
+        for stage in STAGES:
+            if stage.name not in args.stages:
+                continue
+            timings = time_stage(stage, tree, restore, args.repeats, args.warmup)
+            result = {'median': statistics.median(timings), 'min': min(timings),
+                      'max': max(timings), 'runs': timings}
+            if args.profile:
+                result.update(profile_stage(stage, tree, restore, args.profile))
+            results['stages'][stage.name] = result
+    finally:
+        shutil.rmtree(workdir)
+
+    regressions = []
+    if args.save_baseline:
+        write_json(args.baseline, results)
+        print(f"Saved baseline to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.threshold)
+    results['regressions'] = regressions
+    write_json(args.out, results)
+
+    report(results, regressions)
+    print(f"\nResults written to {args.out}")
+    if regressions:
+        print(f"{len(regressions)} stage(s) more than {args.threshold:g}% slower than "
+              f"{args.baseline}: {', '.join(regressions)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
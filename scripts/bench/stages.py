@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""The doc pipeline stages timed by the benchmark suite.
+
+Each stage is a function of a corpus ``Tree``. Stages that rewrite files
+are marked ``mutates`` so the runner restores a pristine copy of the tree
+before every run, outside the timed region. Script output is discarded
+while a stage runs.
+"""
+import contextlib
+import importlib.util
+import os
+from collections import namedtuple
+
+from doc_links import discover_image_mappings, iter_links
+from doc_rewrite import MappingRewriter, rewrite_tree
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+Stage = namedtuple('Stage', ['name', 'run', 'mutates'])
+
+
+def load_script(name):
+    """Import a hyphenated entry script from scripts/ as a module"""
+    spec = importlib.util.spec_from_file_location(
+        name.replace('-', '_'), os.path.join(SCRIPTS_DIR, f'{name}.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+_update_image_paths = load_script('update-image-paths')
+_fix_profile_images = load_script('fix-profile-images')
+
+
+def _quiet(func):
+    def run(tree):
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            return func(tree)
+    return run
+
+
+def compile_mappings(tree):
+    MappingRewriter(tree.mappings)
+
+
+def update_markdown_file(tree):
+    # Compiled once per run, as in update-image-paths.py
+    rewriter = MappingRewriter(tree.mappings)
+    for filepath in tree.files:
+        _update_image_paths.update_markdown_file(filepath, rewriter)
+
+
+def update_markdown_file_stream(tree):
+    rewriter = MappingRewriter(tree.mappings)
+    for filepath in tree.files:
+        _update_image_paths.update_markdown_file(filepath, rewriter, stream=True)
+
+
+def rewrite_tree_pool(tree):
+    # Work done in the pool workers is invisible to --profile in this process
+    rewrite_tree(tree.files, tree.mappings)
+
+
+def fix_profile_management_guide(tree):
+    _fix_profile_images.fix_profile_management_guide([tree.docs_dir])
+
+
+def discover_mappings(tree):
+    discover_image_mappings(tree.files, tree.images_root)
+
+
+def tokenize_links(tree):
+    for filepath in tree.files:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            for _ in iter_links(f.read()):
+                pass
+
+
+STAGES = [
+    Stage('compile_mappings', compile_mappings, False),
+    Stage('update_markdown_file', _quiet(update_markdown_file), True),
+    Stage('update_markdown_file_stream', _quiet(update_markdown_file_stream), True),
+    Stage('rewrite_tree', rewrite_tree_pool, True),
+    Stage('fix_profile_management_guide', _quiet(fix_profile_management_guide), True),
+    Stage('discover_image_mappings', discover_mappings, False),
+    Stage('iter_links', tokenize_links, False),
+]
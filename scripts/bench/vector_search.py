@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Compare top-k query latency of the .npy vector store with the JSON-parse approach.
+
+The baseline mirrors DualLevelRetrieval.lowLevelRetrieve: JSON.parse every
+embedding_json string, then compute cosine similarity row by row. The
+vector store answers the same query with one matmul over a memory-mapped
+float32 matrix. The baseline is linear in the row count, so it runs on a
+sample of rows and is extrapolated for the larger sizes.
+
+Usage: python3 scripts/bench/vector_search.py [--sizes 10000 100000 1000000] [--dim 256]
+"""
+import argparse
+import json
+import math
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+# The doc_* libraries live one directory up
+sys.path.insert(1, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from doc_vectors import VectorIndex  # noqa: E402
+
+BLOCK_ROWS = 50_000
+
+
+def cosine_similarity(a, b):
+    """Row-at-a-time cosine, as in cosineSimilarity in src/lib/utils/openai.ts"""
+    dot = norm_a = norm_b = 0.0
+    for x, y in zip(a, b):
+        dot += x * y
+        norm_a += x * x
+        norm_b += y * y
+    return dot / (math.sqrt(norm_a) * math.sqrt(norm_b))
+
+
+def write_random_index(prefix, rows, dim, rng):
+    """Write a normalised random matrix in blocks so 1M rows never sit in memory twice"""
+    matrix = np.lib.format.open_memmap(f'{prefix}.npy', mode='w+', dtype=np.float32, shape=(rows, dim))
+    for start in range(0, rows, BLOCK_ROWS):
+        block = rng.standard_normal((min(BLOCK_ROWS, rows - start), dim), dtype=np.float32)
+        block /= np.linalg.norm(block, axis=1, keepdims=True)
+        matrix[start:start + len(block)] = block
+    matrix.flush()
+    del matrix
+    with open(f'{prefix}.json', 'w', encoding='utf-8') as f:
+        json.dump({'backend': 'random', 'dim': dim, 'chunks': []}, f)
+
+
+def time_json_baseline(rows, dim, k, rng):
+    embeddings = [json.dumps([round(float(x), 8) for x in row])
+                  for row in rng.standard_normal((rows, dim), dtype=np.float32)]
+    query = rng.standard_normal(dim).tolist()
+    started = time.perf_counter()
+    scores = [cosine_similarity(query, json.loads(embedding)) for embedding in embeddings]
+    sorted(range(rows), key=scores.__getitem__, reverse=True)[:k]
+    return time.perf_counter() - started
+
+
+def time_index(prefix, dim, k, repeats, rng):
+    index = VectorIndex(prefix)
+    index.search(rng.standard_normal(dim), k)  # warm the page cache
+    timings = []
+    for _ in range(repeats):
+        query = rng.standard_normal(dim)
+        started = time.perf_counter()
+        index.search(query, k)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--dim', type=int, default=256)
+    parser.add_argument('-k', type=int, default=5)
+    parser.add_argument('--repeats', type=int, default=20)
+    parser.add_argument('--json-sample', type=int, default=10_000,
+                        help='rows to run through the JSON-parse baseline')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    sample = min(args.json_sample, max(args.sizes))
+    baseline_per_row = time_json_baseline(sample, args.dim, args.k, rng) / sample
+
+    workdir = tempfile.mkdtemp(prefix='bench-vector-search-')
+    try:
+        print(f"{'chunks':>10} {'json parse + cosine':>22} {'mmap matmul':>14} {'speedup':>9}")
+        for rows in args.sizes:
+            prefix = os.path.join(workdir, f'index-{rows}')
+            write_random_index(prefix, rows, args.dim, rng)
+            index_time = time_index(prefix, args.dim, args.k, args.repeats, rng)
+            baseline = baseline_per_row * rows
+            estimated = '*' if rows > sample else ' '
+            print(f"{rows:>10} {baseline * 1000:>20.1f}ms{estimated} {index_time * 1000:>12.2f}ms "
+                  f"{baseline / index_time:>8.0f}x")
+            os.unlink(f'{prefix}.npy')
+        print(f"* extrapolated from {sample} rows")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == '__main__':
+    main()
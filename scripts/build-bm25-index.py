@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Build or query the BM25 keyword index over the docs.
+
+    python3 scripts/build-bm25-index.py
+    python3 scripts/build-bm25-index.py --query "retraction length PETG"
+    python3 scripts/build-bm25-index.py --query "..." --fuse-vectors .cache/vector-index/docs
+
+Indexes the heading chunks of public/docs plus the two large reference
+docs in the repo root. Per-file chunk term counts live in the .cache/
+manifest, so only files whose content changed are re-tokenized; the
+binary index is then rewritten from the cached counts.
+"""
+import argparse
+import json
+import os
+import time
+from collections import Counter
+
+from doc_bm25 import BM25Index, analyze, fuse, write_index
+from doc_cache import Manifest, file_record, fingerprint
+from doc_chunks import MAX_CHUNK_CHARS, chunk_markdown
+from doc_rewrite import iter_markdown_files, write_atomic
+
+DOCS_ROOT = 'public/docs'
+REFERENCE_DOCS = ['OrcaSlicer Comprehensive Settings.md', 'OrcaRAG.md']
+DEFAULT_OUT = '.cache/bm25/docs'
+
+
+def collect_files(roots, files):
+    paths = []
+    for root in roots:
+        paths.extend(iter_markdown_files(root))
+    paths.extend(path for path in files if os.path.exists(path))
+    return paths
+
+
+def index_file(filepath):
+    """Chunk and tokenize one file into manifest-ready chunk records"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        text = f.read()
+    return [{'heading': chunk.heading, 'offset': chunk.offset,
+             'terms': dict(Counter(analyze(f'{chunk.heading}\n{chunk.text}')))}
+            for chunk in chunk_markdown(filepath, text)]
+
+
+def build(paths, out, force=False):
+    settings = {'max_chunk_chars': MAX_CHUNK_CHARS, 'analyzer': 1}
+    manifest = Manifest('bm25-index', fingerprint(settings))
+    if force:
+        manifest.entries = {}
+
+    started = time.perf_counter()
+    reindexed = 0
+    docs = []
+    doc_term_counts = []
+    for filepath in paths:
+        if not manifest.is_fresh(filepath):
+            manifest.record(filepath, dict(file_record(filepath), chunks=index_file(filepath)))
+            reindexed += 1
+        for chunk in manifest.entries[filepath]['chunks']:
+            docs.append({'path': filepath, 'heading': chunk['heading'], 'offset': chunk['offset']})
+            doc_term_counts.append(chunk['terms'])
+
+    # Forget files that are no longer part of the corpus
+    manifest.entries = {path: manifest.entries[path] for path in paths}
+    manifest.save()
+
+    os.makedirs(os.path.dirname(out) or '.', exist_ok=True)
+    write_index(f'{out}.bm25', doc_term_counts)
+    write_atomic(f'{out}.json', json.dumps({'docs': docs}, ensure_ascii=False))
+    print(f"Indexed {len(docs)} chunks from {len(paths)} files ({reindexed} re-tokenized) "
+          f"in {time.perf_counter() - started:.2f}s -> {out}.bm25 "
+          f"({os.path.getsize(f'{out}.bm25') / 1e3:.1f} KB)")
+
+
+def query(out, text, k, vector_prefix=None):
+    with open(f'{out}.json', 'r', encoding='utf-8') as f:
+        docs = json.load(f)['docs']
+    index = BM25Index(f'{out}.bm25')
+    started = time.perf_counter()
+    hits = index.search(text, k)
+    elapsed = time.perf_counter() - started
+    index.close()
+
+    ranked = [((docs[doc]['path'], docs[doc]['offset']), score) for doc, score in hits]
+    headings = {(doc['path'], doc['offset']): doc['heading'] for doc in docs}
+    if vector_prefix:
+        from doc_vectors import VectorIndex, embedder_for
+        vectors = VectorIndex(vector_prefix)
+        query_vector = embedder_for(vectors.meta).embed([text])[0]
+        vector_ranked = []
+        for row, score in vectors.search(query_vector, k):
+            chunk = vectors.chunks[row]
+            key = (chunk['path'], chunk['offset'])
+            headings.setdefault(key, chunk['heading'])
+            vector_ranked.append((key, score))
+        ranked = fuse([ranked, vector_ranked])[:k]
+
+    for (path, offset), score in ranked:
+        print(f"{score:.4f}  {path}  {headings[(path, offset)]}")
+    print(f"(BM25 over {len(docs)} chunks in {elapsed * 1000:.2f} ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or query the BM25 doc index')
+    parser.add_argument('roots', nargs='*', default=[DOCS_ROOT],
+                        help=f'doc trees to index (default: {DOCS_ROOT})')
+    parser.add_argument('--out', default=DEFAULT_OUT,
+                        help=f'output prefix (default: {DEFAULT_OUT})')
+    parser.add_argument('--force', action='store_true',
+                        help='re-tokenize every file, ignoring the .cache/ manifest')
+    parser.add_argument('--query', help='search an existing index instead of building')
+    parser.add_argument('--fuse-vectors', metavar='PREFIX',
+                        help='fuse BM25 hits with this vector index (reciprocal rank fusion)')
+    parser.add_argument('-k', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.query:
+        query(args.out, args.query, args.k, args.fuse_vectors)
+        return
+    build(collect_files(args.roots, REFERENCE_DOCS), args.out, args.force)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Chunk the docs by heading, embed every chunk and write a binary vector store.
+
+    python3 scripts/build-vector-index.py                      # offline hashing embedder
+    python3 scripts/build-vector-index.py --backend openai     # text-embedding-3-small
+    python3 scripts/build-vector-index.py --query "stringing on PETG"
+
+The store is <out>.npy (L2-normalised float32 matrix) plus <out>.json
+(backend and per-chunk metadata); see doc_vectors.py and doc_chunks.py.
+"""
+import argparse
+import time
+
+from doc_chunks import chunk_markdown
+from doc_rewrite import iter_markdown_files
+from doc_vectors import EMBEDDERS, HashingEmbedder, VectorIndex, embedder_for, write_index
+
+DOCS_ROOT = 'public/docs'
+DEFAULT_OUT = '.cache/vector-index/docs'
+
+
+def build(roots, out, embedder):
+    chunks = []
+    for root in roots:
+        for filepath in iter_markdown_files(root):
+            with open(filepath, 'r', encoding='utf-8') as f:
+                chunks.extend(chunk_markdown(filepath, f.read()))
+
+    started = time.perf_counter()
+    matrix = embedder.embed([f'{chunk.heading}\n{chunk.text}' for chunk in chunks])
+    write_index(out, matrix, chunks, embedder)
+    print(f"Embedded {len(chunks)} chunks ({matrix.shape[1]} dims) in "
+          f"{time.perf_counter() - started:.2f}s -> {out}.npy, {out}.json")
+
+
+def query(out, text, k):
+    index = VectorIndex(out)
+    embedder = embedder_for(index.meta)
+    started = time.perf_counter()
+    hits = index.search(embedder.embed([text])[0], k)
+    elapsed = time.perf_counter() - started
+    for row, score in hits:
+        chunk = index.chunks[row]
+        print(f"{score:.3f}  {chunk['path']}  {chunk['heading']}")
+    print(f"({elapsed * 1000:.2f} ms over {index.matrix.shape[0]} chunks)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or query the doc vector index')
+    parser.add_argument('roots', nargs='*', default=[DOCS_ROOT],
+                        help=f'doc trees to index (default: {DOCS_ROOT})')
+    parser.add_argument('--backend', choices=sorted(EMBEDDERS), default='hash')
+    parser.add_argument('--dim', type=int, default=256,
+                        help='vector size for the hash backend')
+    parser.add_argument('--out', default=DEFAULT_OUT,
+                        help=f'output prefix (default: {DEFAULT_OUT})')
+    parser.add_argument('--query', help='search an existing index instead of building')
+    parser.add_argument('-k', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.query:
+        query(args.out, args.query, args.k)
+        return
+
+    embedder = HashingEmbedder(args.dim) if args.backend == 'hash' else EMBEDDERS[args.backend]()
+    build(args.roots, args.out, embedder)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Check that every local image path and #anchor link in the docs resolves.
+
+One walk of the doc tree builds an index of every file plus every heading
+slug of every markdown doc; each link found by the shared doc_links
+tokenizer is then checked against it with set lookups. Remote links are
+not fetched.
+
+Writes a JSON report to stdout, a summary to stderr, and exits with status
+1 when anything is broken.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from urllib.parse import unquote, urlsplit
+
+from doc_links import LineIndex, heading_slugs, is_remote, iter_links
+
+DOCS_ROOT = 'public/docs'
+# Absolute /docs/... urls are served from public/
+PUBLIC_ROOT = 'public'
+
+SKIPPED_SCHEMES = ('mailto:', 'tel:', 'data:', 'javascript:')
+
+
+class DocIndex:
+    """Every file under a root plus the anchor slugs of every markdown doc"""
+
+    def __init__(self, root):
+        self.files = set()
+        self.directories = set()
+        self.anchors = {}
+        self.texts = {}
+        for directory, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            self.directories.add(os.path.normpath(directory))
+            for filename in sorted(filenames):
+                path = os.path.normpath(os.path.join(directory, filename))
+                self.files.add(path)
+                if filename.endswith('.md'):
+                    with open(path, 'r', encoding='utf-8') as f:
+                        text = f.read()
+                    self.texts[path] = text
+                    self.anchors[path] = heading_slugs(text)
+
+
+def resolve(url, doc_path):
+    """Split a local link into (target file, anchor); target is None for #anchors"""
+    parts = urlsplit(url)
+    path = unquote(parts.path)
+    if not path:
+        return None, unquote(parts.fragment)
+    if path.startswith('/'):
+        target = os.path.join(PUBLIC_ROOT, path.lstrip('/'))
+    else:
+        target = os.path.join(os.path.dirname(doc_path), path)
+    return os.path.normpath(target), unquote(parts.fragment)
+
+
+def check_doc(index, doc_path):
+    """Yield a problem dict for every broken link in one doc"""
+    text = index.texts[doc_path]
+    lines = None
+    for link in iter_links(text):
+        url = link.url.strip()
+        if not url or is_remote(url) or url.lower().startswith(SKIPPED_SCHEMES):
+            continue
+
+        target, anchor = resolve(url, doc_path)
+        reason = None
+        if target is not None and target not in index.files and target not in index.directories:
+            reason = 'missing file'
+        elif anchor:
+            anchors = index.anchors.get(target or doc_path)
+            if anchors is not None and anchor.lower() not in anchors:
+                reason = 'missing anchor'
+
+        if reason:
+            lines = lines or LineIndex(text)
+            yield {'file': doc_path, 'line': lines.line(link.offset), 'kind': link.kind,
+                   'url': link.url, 'reason': reason}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check local links and anchors in the docs')
+    parser.add_argument('root', nargs='?', default=DOCS_ROOT,
+                        help=f'doc tree to check (default: {DOCS_ROOT})')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    index = DocIndex(args.root)
+    problems = []
+    for doc_path in sorted(index.texts):
+        problems.extend(check_doc(index, doc_path))
+    elapsed = time.perf_counter() - started
+
+    report = {
+        'root': args.root,
+        'files': len(index.files),
+        'docs': len(index.texts),
+        'anchors': sum(len(slugs) for slugs in index.anchors.values()),
+        'seconds': round(elapsed, 4),
+        'broken': problems,
+    }
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+    for problem in problems:
+        print(f"{problem['file']}:{problem['line']}: {problem['reason']}: {problem['url']}",
+              file=sys.stderr)
+    print(f"Checked {report['docs']} docs against {report['files']} files and "
+          f"{report['anchors']} anchors in {elapsed:.3f}s: {len(problems)} broken",
+          file=sys.stderr)
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == '__main__':
+    main()
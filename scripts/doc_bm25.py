@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Compact BM25 inverted index over doc chunks.
+
+File layout (little endian), designed to be opened with mmap:
+
+    header      magic, version, doc count, term count, avgdl, k1, b,
+                and the offsets of the three sections below
+    doc lengths uint32 per doc
+    terms       per term, sorted: utf-8 term, df, postings offset and size,
+                and the term's maximum possible score (float64, so the
+                bound is the exact score a document can get)
+    postings    per term: varint (doc id delta, tf) pairs
+
+Queries run term-at-a-time, highest-impact terms first. Once the k-th best
+score is above what every remaining term could add, documents that have
+not been seen yet can no longer reach the top k, so no new candidates are
+admitted (the "continue" strategy). Ranking stays exact.
+"""
+import heapq
+import math
+import mmap
+import struct
+from array import array
+
+from doc_chunks import tokenize
+
+MAGIC = b'BM25'
+VERSION = 2
+K1 = 1.2
+B = 0.75
+
+_HEADER = struct.Struct('<4sHIIdddQQQ')
+_TERM = struct.Struct('<IQId')
+_TERM_LEN = struct.Struct('<H')
+
+# Too common in the docs to help ranking
+STOPWORDS = frozenset('''
+a an and are as at be by can for from has have if in into is it its of on or
+that the their then there these this to was were will with you your
+'''.split())
+
+
+def analyze(text):
+    return [token for token in tokenize(text) if token not in STOPWORDS]
+
+
+def _encode_varint(value, out):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _decode_postings(buf, count):
+    """Yield (doc id, tf) pairs from a varint postings block"""
+    pos = 0
+    doc = 0
+    for _ in range(count):
+        for field in range(2):
+            value = shift = 0
+            while True:
+                byte = buf[pos]
+                pos += 1
+                value |= (byte & 0x7F) << shift
+                if byte < 0x80:
+                    break
+                shift += 7
+            if field == 0:
+                doc += value
+            else:
+                yield doc, value
+
+
+def _term_weight(tf, doc_length, avgdl, k1, b):
+    return tf * (k1 + 1) / (tf + k1 * (1 - b + b * doc_length / avgdl))
+
+
+def write_index(path, doc_term_counts, k1=K1, b=B):
+    """Write an index for ``doc_term_counts``: one ``{term: tf}`` dict per doc id"""
+    doc_lengths = array('I', (sum(counts.values()) for counts in doc_term_counts))
+    n_docs = len(doc_lengths)
+    avgdl = (sum(doc_lengths) / n_docs) if n_docs else 1.0
+
+    postings = {}
+    for doc, counts in enumerate(doc_term_counts):
+        for term, tf in counts.items():
+            postings.setdefault(term, []).append((doc, tf))
+
+    terms = bytearray()
+    blocks = bytearray()
+    for term in sorted(postings):
+        entries = postings[term]
+        df = len(entries)
+        idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+        max_score = idf * max(_term_weight(tf, doc_lengths[doc], avgdl, k1, b) for doc, tf in entries)
+
+        start = len(blocks)
+        previous = 0
+        for doc, tf in entries:
+            _encode_varint(doc - previous, blocks)
+            _encode_varint(tf, blocks)
+            previous = doc
+
+        encoded = term.encode('utf-8')
+        terms += _TERM_LEN.pack(len(encoded)) + encoded
+        terms += _TERM.pack(df, start, len(blocks) - start, max_score)
+
+    lengths_offset = _HEADER.size
+    terms_offset = lengths_offset + len(doc_lengths) * doc_lengths.itemsize
+    postings_offset = terms_offset + len(terms)
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, n_docs, len(postings), avgdl, k1, b,
+                             lengths_offset, terms_offset, postings_offset))
+        f.write(doc_lengths.tobytes())
+        f.write(terms)
+        f.write(blocks)
+
+
+class BM25Index:
+    """Read side: postings and doc lengths are read straight from the mmap"""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mm)
+        (magic, version, self.n_docs, n_terms, self.avgdl, self.k1, self.b,
+         lengths_offset, terms_offset, self._postings_offset) = _HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'{path} is not a version {VERSION} BM25 index')
+
+        self.doc_lengths = view[lengths_offset:terms_offset].cast('I')
+        self.terms = {}
+        pos = terms_offset
+        for _ in range(n_terms):
+            (length,) = _TERM_LEN.unpack_from(view, pos)
+            pos += _TERM_LEN.size
+            term = bytes(view[pos:pos + length]).decode('utf-8')
+            pos += length
+            self.terms[term] = _TERM.unpack_from(view, pos)
+            pos += _TERM.size
+
+    def search(self, text, k=10):
+        """Return ``[(doc id, score), ...]`` for the k best matches of ``text``"""
+        if k <= 0:
+            return []
+        query_terms = [term for term in dict.fromkeys(analyze(text)) if term in self.terms]
+        # Highest-impact terms first so the k-th score rises quickly
+        query_terms.sort(key=lambda term: self.terms[term][3], reverse=True)
+        bounds = [self.terms[term][3] for term in query_terms]
+
+        scores = {}
+        admit_new = True
+        for position, term in enumerate(query_terms):
+            df, offset, size, _ = self.terms[term]
+            # Summed in the same order as a document's score, so it is never below it
+            remaining = sum(bounds[position + 1:])
+            idf = math.log(1 + (self.n_docs - df + 0.5) / (df + 0.5))
+            start = self._postings_offset + offset
+            for doc, tf in _decode_postings(self._mm[start:start + size], df):
+                if not admit_new and doc not in scores:
+                    continue
+                weight = _term_weight(tf, self.doc_lengths[doc], self.avgdl, self.k1, self.b)
+                scores[doc] = scores.get(doc, 0.0) + idf * weight
+
+            if admit_new and len(scores) >= k:
+                kth = heapq.nlargest(k, scores.values())[-1]
+                # A document that only ties the k-th score can still win on doc id
+                admit_new = kth <= remaining
+
+        return heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
+
+    def close(self):
+        self.doc_lengths.release()
+        self._mm.close()
+
+
+def fuse(ranked_lists, k=60):
+    """Reciprocal rank fusion of several ``[(key, score), ...]`` lists, best first"""
+    fused = {}
+    for ranked in ranked_lists:
+        for rank, (key, _) in enumerate(ranked):
+            fused[key] = fused.get(key, 0.0) + 1.0 / (k + rank + 1)
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
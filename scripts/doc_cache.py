@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Persistent manifest used to skip doc files that have not changed.
+
+Each entry records a file's size, mtime and content hash. The manifest as a
+whole is tied to a fingerprint of whatever drives the rewrite (for example
+the image mapping table); when the fingerprint changes every entry is
+discarded.
+"""
+import hashlib
+import json
+import os
+
+from doc_rewrite import write_atomic
+
+CACHE_DIR = '.cache'
+
+
+def fingerprint(obj):
+    """Return a stable hash of a JSON-serialisable object"""
+    data = json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def hash_file(filepath):
+    with open(filepath, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def file_record(filepath):
+    """Return the manifest entry for a file as it is on disk now"""
+    digest = hash_file(filepath)
+    st = os.stat(filepath)
+    return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'sha256': digest}
+
+
+class Manifest:
+    """JSON manifest of file records stored under ``.cache/``."""
+
+    def __init__(self, name, key):
+        self.path = os.path.join(CACHE_DIR, f'{name}.json')
+        self.key = key
+        self.entries = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('fingerprint') == key:
+            self.entries = data.get('files', {})
+
+    def is_fresh(self, filepath):
+        """True if ``filepath`` is unchanged since it was last recorded.
+
+        Size and mtime are checked first so unchanged files are never
+        opened; the content hash is only read when the mtime moved.
+        """
+        entry = self.entries.get(filepath)
+        if entry is None:
+            return False
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return False
+        if st.st_size != entry['size']:
+            return False
+        if st.st_mtime_ns == entry['mtime_ns']:
+            return True
+        if hash_file(filepath) != entry['sha256']:
+            return False
+        # Touched but identical (e.g. a git checkout): refresh the mtime
+        entry['mtime_ns'] = st.st_mtime_ns
+        return True
+
+    def record(self, filepath, entry=None):
+        self.entries[filepath] = entry if entry is not None else file_record(filepath)
+
+    def save(self):
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        files = {path: entry for path, entry in sorted(self.entries.items())
+                 if os.path.exists(path)}
+        write_atomic(self.path, json.dumps({'fingerprint': self.key, 'files': files}, indent=1))
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Heading-based chunking and tokenizing shared by the retrieval indexes."""
+import re
+from collections import namedtuple
+
+from doc_links import iter_heading_matches
+
+# Chunks longer than this are split further at paragraph breaks
+MAX_CHUNK_CHARS = 2000
+
+Chunk = namedtuple('Chunk', ['path', 'heading', 'offset', 'text'])
+
+_PARAGRAPH_RE = re.compile(r'\n\s*\n')
+_TOKEN_RE = re.compile(r'[a-z0-9]+(?:[._-][a-z0-9]+)*')
+
+
+def _split_long(text, offset, max_chars):
+    """Pack paragraphs of an over-long section into pieces of at most max_chars"""
+    if len(text) <= max_chars:
+        yield offset, text
+        return
+    paragraphs = []
+    start = 0
+    for match in _PARAGRAPH_RE.finditer(text):
+        paragraphs.append((start, match.start()))
+        start = match.end()
+    paragraphs.append((start, len(text)))
+
+    piece_start = piece_end = None
+    for start, end in paragraphs:
+        if piece_start is not None and end - piece_start > max_chars:
+            yield from _hard_split(text, offset, piece_start, piece_end, max_chars)
+            piece_start = None
+        if piece_start is None:
+            piece_start = start
+        piece_end = end
+    yield from _hard_split(text, offset, piece_start, piece_end, max_chars)
+
+
+def _hard_split(text, offset, start, end, max_chars):
+    # A single paragraph longer than max_chars is cut at fixed intervals
+    for piece in range(start, end, max_chars):
+        yield offset + piece, text[piece:min(piece + max_chars, end)]
+
+
+def chunk_markdown(path, text, max_chars=MAX_CHUNK_CHARS):
+    """Split a markdown doc into one chunk per heading section.
+
+    Each chunk carries its heading trail (``Guide > Setup > Step 1``) so a
+    hit can be shown in context.
+    """
+    headings = list(iter_heading_matches(text))
+    boundaries = [offset for offset, _, _ in headings] + [len(text)]
+    sections = [(0, '', boundaries[0])] if boundaries[0] > 0 else []
+    trail = []
+    for (offset, level, heading), end in zip(headings, boundaries[1:]):
+        trail = [item for item in trail if item[0] < level] + [(level, heading.strip())]
+        sections.append((offset, ' > '.join(title for _, title in trail), end))
+
+    for start, heading, end in sections:
+        section = text[start:end]
+        if not section.strip():
+            continue
+        for offset, piece in _split_long(section, start, max_chars):
+            if piece.strip():
+                yield Chunk(path, heading, offset, piece.strip())
+
+
+def tokenize(text):
+    """Lowercase word tokens; dotted/hyphenated settings like 0.4 or z-hop stay whole"""
+    return _TOKEN_RE.findall(text.lower())
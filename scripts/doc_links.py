@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""Link tokenizer shared by the doc maintenance scripts.
+
+A single regex pass over a markdown document yields every inline image,
+inline link, HTML ``<img>`` and reference-style link definition, while
+skipping fenced code blocks so example snippets are never reported. Heading
+anchors are extracted the same way so links can be checked against them.
+"""
+import os
+import re
+from bisect import bisect_right
+from collections import namedtuple
+from urllib.parse import unquote, urlsplit
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif', '.svg')
+
+# kind is one of 'image', 'link', 'html-img' or 'ref'
+Link = namedtuple('Link', ['kind', 'url', 'offset'])
+
+_TOKEN_RE = re.compile(r'''
+    (?P<fence>^[ ]{0,3}(?P<mark>`{3,}|~{3,})[^\n]*\n.*?(?:^[ ]{0,3}(?P=mark)[ \t]*$|\Z))
+  | !\[[^\]]*\]\(\s*(?P<image><[^>\n]*>|[^\s)]+)(?:\s+(?:"[^"]*"|'[^']*'))?\s*\)
+  | (?<![!\]\\])\[[^\]]*\]\(\s*(?P<link><[^>\n]*>|[^\s)]+)(?:\s+(?:"[^"]*"|'[^']*'))?\s*\)
+  | <img\b[^>]*?\bsrc\s*=\s*(?P<q>["'])(?P<html>.*?)(?P=q)[^>]*>
+  | ^[ ]{0,3}\[(?P<ref_id>[^\]\n]+)\]:[ \t]*(?P<ref><[^>\n]*>|\S+)
+''', re.MULTILINE | re.DOTALL | re.VERBOSE | re.IGNORECASE)
+
+_HEADING_RE = re.compile(r'''
+    (?P<fence>^[ ]{0,3}(?P<mark>`{3,}|~{3,})[^\n]*\n.*?(?:^[ ]{0,3}(?P=mark)[ \t]*$|\Z))
+  | ^[ ]{0,3}(?P<level>\#{1,6})[ \t]+(?P<heading>[^\n]*?)(?:[ \t]+\#+)?[ \t]*$
+''', re.MULTILINE | re.DOTALL | re.VERBOSE)
+
+_KINDS = (('image', 'image'), ('link', 'link'), ('html', 'html-img'), ('ref', 'ref'))
+
+
+def iter_links(text):
+    """Yield a Link for every link-like token in a markdown document"""
+    for match in _TOKEN_RE.finditer(text):
+        if match.group('fence') is not None:
+            continue
+        for group, kind in _KINDS:
+            url = match.group(group)
+            if url is not None:
+                if url.startswith('<') and url.endswith('>'):
+                    url = url[1:-1]
+                yield Link(kind, url, match.start(group))
+                break
+
+
+_INLINE_LINK_RE = re.compile(r'!?\[([^\]]*)\]\([^)]*\)')
+_SLUG_DROP_RE = re.compile(r'[^\w\- ]')
+
+
+def iter_heading_matches(text):
+    """Yield ``(offset, level, heading)`` for every ATX heading outside fenced code"""
+    for match in _HEADING_RE.finditer(text):
+        if match.group('heading') is not None:
+            yield match.start(), len(match.group('level')), match.group('heading')
+
+
+def iter_headings(text):
+    """Yield the text of every ATX heading outside fenced code blocks"""
+    for _, _, heading in iter_heading_matches(text):
+        yield heading
+
+
+def heading_slugs(text):
+    """Return the set of GitHub-style anchor slugs for a document's headings"""
+    slugs = set()
+    seen = {}
+    for heading in iter_headings(text):
+        plain = _INLINE_LINK_RE.sub(r'\1', heading).replace('`', '').replace('*', '')
+        slug = _SLUG_DROP_RE.sub('', plain.strip().lower()).replace(' ', '-')
+        count = seen.get(slug, 0)
+        seen[slug] = count + 1
+        slugs.add(slug if count == 0 else f'{slug}-{count}')
+    return slugs
+
+
+class LineIndex:
+    """Map character offsets back to 1-based line numbers"""
+
+    def __init__(self, text):
+        self._starts = [0] + [m.end() for m in re.finditer('\n', text)]
+
+    def line(self, offset):
+        return bisect_right(self._starts, offset)
+
+
+def is_remote(url):
+    return url.startswith(('http://', 'https://', '//'))
+
+
+def is_image_url(url):
+    return urlsplit(url).path.lower().endswith(IMAGE_EXTENSIONS)
+
+
+def iter_remote_images(text):
+    """Yield Links that reference a remote image"""
+    for link in iter_links(text):
+        if not is_remote(link.url):
+            continue
+        if link.kind in ('image', 'html-img') or (link.kind == 'ref' and is_image_url(link.url)):
+            yield link
+
+
+def is_rewritable(text, link):
+    """True if MappingRewriter would rewrite ``link`` once its url is mapped.
+
+    The rewriter keeps the exact behaviour of the original per-mapping
+    ``re.sub`` loop, so it only touches the plain ``![alt](url)`` form: no
+    title, no ``<url>``, no ``<img>`` or reference definitions.
+    """
+    return (link.kind == 'image'
+            and text.startswith('](', link.offset - 2)
+            and text.startswith(')', link.offset + len(link.url)))
+
+
+# Cache-busting content hashes that static site generators append to file names
+_HASH_SUFFIX_RE = re.compile(r'-[0-9a-f]{16,}(?=\.[^.]+$)')
+_CAMEL_RE = re.compile(r'(?<=[a-z0-9])(?=[A-Z])')
+
+
+def _kebab(name):
+    return _CAMEL_RE.sub('-', name).lower()
+
+
+def derive_local_path(url, doc_path):
+    """Return the ``../images/<section>/<file>`` path a remote image is mirrored at.
+
+    The section comes from the directories after ``images/`` in the url
+    (``InputShaping`` becomes ``input-shaping``); urls without one use the
+    directory of the doc that links to them. Returns None when the url path
+    has no file name (``https://example.com/`` or ``.../images/``).
+    """
+    path = urlsplit(url).path
+    if not path or path.endswith('/'):
+        return None
+    parts = [unquote(part) for part in path.split('/') if part]
+    filename = _HASH_SUFFIX_RE.sub('', parts[-1])
+    directories = parts[:-1]
+
+    section = ''
+    if 'images' in directories:
+        last = len(directories) - 1 - directories[::-1].index('images')
+        section = '/'.join(_kebab(part) for part in directories[last + 1:])
+    if not section:
+        section = os.path.basename(os.path.dirname(os.path.abspath(doc_path)))
+    return f'../images/{section}/{filename}'
+
+
+def mirror_path(images_root, local_path):
+    """The file below ``images_root`` that a ``../images/...`` doc path refers to"""
+    return os.path.join(images_root, local_path[len('../images/'):])
+
+
+class MissingImages:
+    """Remote image urls whose mirrored file does not exist, and the docs linking them"""
+
+    def __init__(self):
+        # url -> (local path or None, [docs])
+        self.urls = {}
+
+    def add(self, url, local_path, filepath):
+        _, docs = self.urls.setdefault(url, (local_path, []))
+        if filepath not in docs:
+            docs.append(filepath)
+
+    def docs_by_image(self, images_root):
+        """Return ``{mirror file path: set of docs}`` for urls that have a file name"""
+        images = {}
+        for local_path, docs in self.urls.values():
+            if local_path is not None:
+                image = os.path.normpath(mirror_path(images_root, local_path))
+                images.setdefault(image, set()).update(docs)
+        return images
+
+
+def print_missing(missing):
+    for url, (local_path, docs) in sorted(missing.urls.items()):
+        if local_path is None:
+            print(f"Skipped {url}: no file name to mirror it under")
+        else:
+            print(f"Missing local image {local_path} for {url}")
+        for doc in docs:
+            print(f"  linked from {doc}")
+
+
+def discover_image_mappings(filepaths, images_root, known=None):
+    """Build a remote url -> local path table from the docs themselves.
+
+    Entries in ``known`` take precedence over derived paths. Returns
+    ``(mappings, missing, count)``: ``mappings`` is ``known`` extended with
+    every newly seen url whose mirrored file exists, ``missing`` is a
+    MissingImages of the urls whose file does not exist under
+    ``images_root``, and ``count`` is the number of remote image links seen.
+    Urls without a file name cannot be mirrored; they are listed in
+    ``missing`` with a derived path of None. Links in forms the rewriter
+    leaves alone (see ``is_rewritable``) are never mapped, but are still
+    reported in ``missing`` when their file is not mirrored.
+    """
+    mappings = dict(known or {})
+    missing = MissingImages()
+    count = 0
+    for filepath in filepaths:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            text = f.read()
+        for link in iter_remote_images(text):
+            count += 1
+            local_path = mappings.get(link.url) or derive_local_path(link.url, filepath)
+            if local_path is not None and os.path.exists(mirror_path(images_root, local_path)):
+                if is_rewritable(text, link):
+                    mappings.setdefault(link.url, local_path)
+                continue
+            # Leave the remote link alone rather than point it at nothing
+            missing.add(link.url, local_path, filepath)
+    return mappings, missing, count
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Rule-based patching of scraped markdown docs.
+
+A rule is a regex plus a replacement, applied in order to whatever docs
+exist on disk. Only files whose patched output differs from the input are
+written, and a dry run reports the changes as a unified diff
+instead of writing anything.
+"""
+import difflib
+import re
+from collections import namedtuple
+
+from doc_rewrite import write_atomic
+
+# replacement is a re.sub template, or a callable taking (match, filepath)
+PatchRule = namedtuple('PatchRule', ['name', 'pattern', 'replacement'])
+
+
+def rule(name, pattern, replacement, flags=0):
+    return PatchRule(name, re.compile(pattern, flags), replacement)
+
+
+def apply_rules(text, rules, filepath=''):
+    """Return ``(patched text, {rule name: substitutions})``
+
+    Only matches the rule actually changed are counted; a callable may
+    return ``match.group(0)`` to leave a match alone.
+    """
+    counts = {}
+    for patch in rules:
+        changed = 0
+
+        def substitute(match, patch=patch):
+            nonlocal changed
+            if callable(patch.replacement):
+                new = patch.replacement(match, filepath)
+            else:
+                new = match.expand(patch.replacement)
+            changed += new != match.group(0)
+            return new
+
+        text = patch.pattern.sub(substitute, text)
+        if changed:
+            counts[patch.name] = changed
+    return text, counts
+
+
+def patch_files(filepaths, rules, dry_run=False):
+    """Apply ``rules`` to each file; yield ``(filepath, counts, diff)`` for files that change.
+
+    ``diff`` is a unified diff of the change. Files are only written when
+    not a dry run.
+    """
+    for filepath in filepaths:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            original = f.read()
+        patched, counts = apply_rules(original, rules, filepath)
+        if patched == original:
+            continue
+
+        diff = ''.join(difflib.unified_diff(
+            original.splitlines(keepends=True), patched.splitlines(keepends=True),
+            fromfile=f'a/{filepath.lstrip("/")}', tofile=f'b/{filepath.lstrip("/")}'))
+        if not dry_run:
+            write_atomic(filepath, patched)
+        yield filepath, counts, diff
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""Single-pass rewriting of markdown image URLs.
+
+The mapping table is compiled once into a character trie. Each document is
+then scanned a single time: every ``![alt](`` opener is followed by an
+anchored walk of the trie, so the cost is linear in the document size and
+independent of how many mappings exist.
+
+Whole doc trees can be rewritten across a process pool; files are written
+atomically so an interrupted run never leaves a half-written document.
+Large files can be streamed in fixed-size chunks so peak memory does not
+grow with the document size.
+"""
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Characters read per chunk when streaming a file
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class MappingRewriter:
+    """Rewrite ``![alt](url)`` links whose url is a key of ``mappings``.
+
+    The output is identical to running one ``re.sub`` per mapping, in dict
+    order, with the pattern ``!\\[([^\\]]*)\\]\\(<url>\\)``. That means it
+    does not share the doc_links tokenizer: links inside fenced code are
+    rewritten too, and titled, ``<url>`` and HTML forms are left alone.
+    """
+
+    def __init__(self, mappings):
+        self.mappings = dict(mappings)
+        self._trie = {}
+        for order, (old_url, new_path) in enumerate(self.mappings.items()):
+            node = self._trie
+            for ch in old_url:
+                node = node.setdefault(ch, {})
+            # The None key marks the end of a url; earlier mappings win ties
+            # just like they would in the sequential re.sub loop.
+            node.setdefault(None, (order, new_path))
+
+    def rewrite(self, text):
+        """Return ``text`` with every mapped image url replaced."""
+        output, _, _, _ = self._rewrite(text, final=True)
+        return output
+
+    def rewrite_stream(self, src, dst, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Rewrite text read from ``src`` into ``dst``; return True if anything changed.
+
+        Alt text is copied through as it is read; only the ``](url`` tail of
+        a link that may continue into the next chunk is carried over. Memory
+        use is therefore bounded by ``chunk_size`` plus the longest url rather
+        than by the document size, even when an ``![`` is never closed. The
+        output is identical to ``rewrite`` on the whole text.
+        """
+        carry = ''
+        in_alt = False
+        changed = False
+        while True:
+            chunk = src.read(chunk_size)
+            output, carry, chunk_changed, in_alt = self._rewrite(
+                carry + chunk, final=not chunk, in_alt=in_alt)
+            dst.write(output)
+            changed = changed or chunk_changed
+            if not chunk:
+                return changed
+
+    def _rewrite(self, text, final, in_alt=False):
+        """Rewrite ``text`` and return ``(output, carry, changed, in_alt)``.
+
+        When ``final`` is false, ``text`` is only a prefix of the document and
+        the part of a link that might continue past its end is left
+        unprocessed in ``carry`` so the caller can prepend it to the next
+        chunk. ``in_alt`` is true when the carry (possibly empty) continues the
+        alt text of an ``![`` that was already emitted.
+        """
+        out = []
+        n = len(text)
+        emitted = 0
+        search = 0
+        changed = False
+        hold = n
+        carry_in_alt = False
+
+        while True:
+            if in_alt:
+                # The '![' was in an earlier chunk; its alt text starts here
+                start = -2
+                in_alt = False
+            else:
+                start = text.find('![', search)
+                if start < 0:
+                    if not final and text.endswith('!'):
+                        hold = n - 1
+                    break
+
+            # The alt text runs to the first ']', which must be followed by '('
+            close = text.find(']', start + 2)
+            if close < 0 or close + 1 >= n:
+                if not final:
+                    # Alt text never changes, so flush it and hold only the ']'
+                    hold = n if close < 0 else close
+                    carry_in_alt = True
+                break
+            if text[close + 1] != '(':
+                search = close + 1
+                continue
+
+            node = self._trie
+            i = close + 2
+            best = None
+            incomplete = False
+            while node is not None:
+                if i >= n:
+                    incomplete = True
+                    break
+                hit = node.get(None)
+                if hit is not None and text[i] == ')' and (best is None or hit[0] < best[0]):
+                    best = (hit[0], hit[1], i)
+                node = node.get(text[i])
+                i += 1
+
+            if incomplete and not final:
+                hold = close
+                carry_in_alt = True
+                break
+
+            if best is None:
+                search = close + 1
+                continue
+
+            _, new_path, url_end = best
+            out.append(text[emitted:close + 2])
+            out.append(new_path)
+            if new_path != text[close + 2:url_end]:
+                changed = True
+            emitted = url_end
+            search = url_end + 1
+
+        out.append(text[emitted:hold])
+        return ''.join(out), text[hold:], changed, carry_in_alt
+
+
+def _mkstemp_next_to(filepath):
+    directory = os.path.dirname(filepath) or '.'
+    return tempfile.mkstemp(dir=directory, prefix=f'.{os.path.basename(filepath)}.', suffix='.tmp')
+
+
+def _replace_with(tmp_path, filepath):
+    # mkstemp creates the file as 0600; keep the original permissions
+    if os.path.exists(filepath):
+        os.chmod(tmp_path, os.stat(filepath).st_mode & 0o777)
+    os.replace(tmp_path, filepath)
+
+
+def write_atomic(filepath, content):
+    """Write ``content`` to a temp file next to ``filepath``, then rename it into place."""
+    fd, tmp_path = _mkstemp_next_to(filepath)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        _replace_with(tmp_path, filepath)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def rewrite_file(filepath, rewriter, stream=False, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Rewrite one markdown file in place; return True if it changed.
+
+    With ``stream`` the file is rewritten chunk by chunk into a temp file
+    instead of being read into memory; the result is byte for byte the same.
+    """
+    if stream:
+        return _rewrite_file_streaming(filepath, rewriter, chunk_size)
+
+    with open(filepath, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    new_content = rewriter.rewrite(content)
+    if new_content == content:
+        return False
+
+    write_atomic(filepath, new_content)
+    return True
+
+
+def _rewrite_file_streaming(filepath, rewriter, chunk_size):
+    fd, tmp_path = _mkstemp_next_to(filepath)
+    try:
+        with open(filepath, 'r', encoding='utf-8') as src, \
+                os.fdopen(fd, 'w', encoding='utf-8') as dst:
+            changed = rewriter.rewrite_stream(src, dst, chunk_size)
+        if changed:
+            _replace_with(tmp_path, filepath)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+    return changed
+
+
+def iter_markdown_files(root):
+    """Yield every ``.md`` file below ``root`` in a stable, sorted order."""
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from iter_markdown_files(entry.path)
+        elif entry.is_file() and entry.name.endswith('.md'):
+            yield entry.path
+
+
+# Each pool worker compiles the mapping table once in its initializer
+_worker_rewriter = None
+_worker_stream = False
+
+
+def _init_worker(mappings, stream):
+    global _worker_rewriter, _worker_stream
+    _worker_rewriter = MappingRewriter(mappings)
+    _worker_stream = stream
+
+
+def _rewrite_task(filepath):
+    started = time.perf_counter()
+    changed = rewrite_file(filepath, _worker_rewriter, stream=_worker_stream)
+    elapsed = time.perf_counter() - started
+    return filepath, changed, os.getpid(), os.path.getsize(filepath), elapsed
+
+
+def rewrite_tree(filepaths, mappings, workers=None, stream=False):
+    """Rewrite ``filepaths`` on a process pool.
+
+    Returns ``(results, stats)``: ``results`` maps each path to whether it
+    changed, in input order, and ``stats`` maps each worker pid to
+    ``{'files', 'bytes', 'seconds'}``.
+    """
+    filepaths = list(filepaths)
+    workers = workers or os.cpu_count() or 1
+    results = {}
+    stats = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(mappings, stream)) as pool:
+        chunksize = max(1, len(filepaths) // (4 * workers))
+        for filepath, changed, pid, size, elapsed in pool.map(
+                _rewrite_task, filepaths, chunksize=chunksize):
+            results[filepath] = changed
+            worker = stats.setdefault(pid, {'files': 0, 'bytes': 0, 'seconds': 0.0})
+            worker['files'] += 1
+            worker['bytes'] += size
+            worker['seconds'] += elapsed
+    return results, stats
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Doc chunk embeddings and a memory-mapped float32 vector store.
+
+The store is two files sharing a prefix: ``<prefix>.npy`` holds an
+L2-normalised ``(chunks, dim)`` float32 matrix and ``<prefix>.json`` holds
+the backend description plus one metadata record per row. Because rows are
+unit length, cosine similarity for every chunk is a single matrix-vector
+product against the memory-mapped matrix.
+
+Requires NumPy (pip install numpy); the openai backend also needs the
+openai package and OPENAI_API_KEY.
+"""
+import hashlib
+import json
+import math
+import os
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    sys.exit('The vector index needs NumPy: pip install numpy')
+
+from doc_chunks import tokenize
+
+
+class HashingEmbedder:
+    """Deterministic offline embedder: signed feature hashing of words and bigrams.
+
+    Good enough to exercise the index and for tests; it has no notion of
+    meaning beyond shared vocabulary.
+    """
+
+    name = 'hash'
+
+    def __init__(self, dim=256):
+        self.dim = dim
+
+    def describe(self):
+        return {'backend': self.name, 'dim': self.dim}
+
+    def _bucket(self, feature):
+        digest = hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest()
+        value = int.from_bytes(digest, 'little')
+        return value % self.dim, 1.0 if value >> 63 else -1.0
+
+    def embed(self, texts):
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            tokens = tokenize(text)
+            counts = {}
+            for feature in tokens + [f'{a} {b}' for a, b in zip(tokens, tokens[1:])]:
+                counts[feature] = counts.get(feature, 0) + 1
+            for feature, count in counts.items():
+                index, sign = self._bucket(feature)
+                matrix[row, index] += sign * (1.0 + math.log(count))
+        return matrix
+
+
+class OpenAIEmbedder:
+    """Embeddings from the OpenAI API, matching the model the ingest scripts use"""
+
+    name = 'openai'
+
+    def __init__(self, model='text-embedding-3-small', batch_size=100):
+        from openai import OpenAI
+        self.client = OpenAI()
+        self.model = model
+        self.batch_size = batch_size
+
+    def describe(self):
+        return {'backend': self.name, 'model': self.model}
+
+    def embed(self, texts):
+        rows = []
+        for start in range(0, len(texts), self.batch_size):
+            # Same input cap as generateEmbedding in the TypeScript scripts
+            batch = [text[:8000] for text in texts[start:start + self.batch_size]]
+            response = self.client.embeddings.create(model=self.model, input=batch)
+            rows.extend(item.embedding for item in response.data)
+        return np.asarray(rows, dtype=np.float32)
+
+
+EMBEDDERS = {
+    'hash': HashingEmbedder,
+    'openai': OpenAIEmbedder,
+}
+
+
+def embedder_for(meta):
+    """Recreate the embedder an index was built with, for embedding queries"""
+    if meta['backend'] == 'hash':
+        return HashingEmbedder(meta['dim'])
+    return EMBEDDERS[meta['backend']](model=meta['model'])
+
+
+def normalize_rows(matrix):
+    """L2-normalise each row in place; all-zero rows stay zero"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def write_index(prefix, matrix, chunks, embedder):
+    """Write ``<prefix>.npy`` and its ``<prefix>.json`` metadata sidecar"""
+    directory = os.path.dirname(prefix)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    np.save(f'{prefix}.npy', normalize_rows(np.ascontiguousarray(matrix, dtype=np.float32)))
+    meta = dict(embedder.describe(), dim=int(matrix.shape[1]),
+                chunks=[chunk._asdict() for chunk in chunks])
+    with open(f'{prefix}.json', 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False)
+
+
+class VectorIndex:
+    """Read side of the store: the matrix stays memory-mapped"""
+
+    def __init__(self, prefix):
+        self.matrix = np.load(f'{prefix}.npy', mmap_mode='r')
+        with open(f'{prefix}.json', 'r', encoding='utf-8') as f:
+            self.meta = json.load(f)
+        self.chunks = self.meta['chunks']
+
+    def search(self, query_vector, k=5):
+        """Return ``[(row, score), ...]`` for the k rows most similar to query_vector"""
+        query = np.asarray(query_vector, dtype=np.float32).ravel()
+        norm = np.linalg.norm(query)
+        if norm > 0:
+            query = query / norm
+        scores = self.matrix @ query
+        k = min(k, scores.shape[0])
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [(int(row), float(scores[row])) for row in top]
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Debounced file watching for the doc maintenance scripts.
+
+Change notifications come from watchdog (inotify on Linux) when it is
+installed, otherwise from diffing a stat snapshot of the tree on a timer.
+Either way, changed paths are pushed onto an asyncio queue and coalesced:
+a batch is only handed over once the tree has been quiet for ``debounce``
+seconds, so a git checkout touching a thousand files triggers one rebuild
+rather than a thousand. Events that arrive while a batch is being rebuilt
+are collected into the next one.
+"""
+import asyncio
+import os
+import sys
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+DEFAULT_DEBOUNCE = 0.5
+DEFAULT_POLL_INTERVAL = 1.0
+# Flush a batch even if events never stop arriving
+MAX_BATCH_DELAY = 10.0
+
+# Reading files also raises watchdog events; only content changes matter
+_CHANGE_EVENTS = frozenset(['created', 'modified', 'moved', 'deleted'])
+
+
+def backend(poll_interval=None):
+    """Describe the event source ``watch`` will use"""
+    if Observer is not None and poll_interval is None:
+        return 'watchdog'
+    return f'polling every {poll_interval or DEFAULT_POLL_INTERVAL:g}s'
+
+
+class _QueueHandler(FileSystemEventHandler):
+    """Forward watchdog events from the observer thread to the event loop"""
+
+    def __init__(self, loop, queue):
+        super().__init__()
+        self._loop = loop
+        self._queue = queue
+
+    def on_any_event(self, event):
+        if event.is_directory or event.event_type not in _CHANGE_EVENTS:
+            return
+        for path in (event.src_path, getattr(event, 'dest_path', '')):
+            if path:
+                self._loop.call_soon_threadsafe(self._queue.put_nowait, os.fsdecode(path))
+
+
+def snapshot(roots):
+    """Return ``{path: (size, mtime_ns)}`` for every file below ``roots``"""
+    files = {}
+    for root in roots:
+        for dirpath, _, filenames in os.walk(root):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                files[path] = (st.st_size, st.st_mtime_ns)
+    return files
+
+
+async def _poll(roots, queue, interval):
+    loop = asyncio.get_running_loop()
+    previous = await loop.run_in_executor(None, snapshot, roots)
+    while True:
+        await asyncio.sleep(interval)
+        current = await loop.run_in_executor(None, snapshot, roots)
+        for path in previous.keys() | current.keys():
+            if previous.get(path) != current.get(path):
+                queue.put_nowait(path)
+        previous = current
+
+
+async def _batches(queue, debounce):
+    """Yield sets of paths, each closed after ``debounce`` quiet seconds"""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = {await queue.get()}
+        deadline = loop.time() + MAX_BATCH_DELAY
+        while True:
+            timeout = min(debounce, deadline - loop.time())
+            if timeout <= 0:
+                break
+            try:
+                batch.add(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        yield batch
+
+
+async def _watch(roots, on_batch, debounce, poll_interval):
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    observer = poller = None
+    if Observer is not None and poll_interval is None:
+        observer = Observer()
+        handler = _QueueHandler(loop, queue)
+        for root in roots:
+            observer.schedule(handler, root, recursive=True)
+        observer.start()
+    else:
+        poller = loop.create_task(_poll(roots, queue, poll_interval or DEFAULT_POLL_INTERVAL))
+
+    try:
+        async for batch in _batches(queue, debounce):
+            # Rebuild off the loop so new events keep queueing meanwhile
+            try:
+                await loop.run_in_executor(None, on_batch, sorted(batch))
+            except Exception as exc:
+                print(f"Rebuild failed: {exc!r}", file=sys.stderr)
+    finally:
+        if observer is not None:
+            observer.stop()
+            observer.join()
+        if poller is not None:
+            poller.cancel()
+
+
+def watch(roots, on_batch, debounce=DEFAULT_DEBOUNCE, poll_interval=None):
+    """Call ``on_batch(paths)`` for each debounced batch of changed files.
+
+    ``paths`` is a sorted list and includes deleted files. Polling is used
+    when watchdog is not installed or ``poll_interval`` is given. Runs until
+    interrupted.
+    """
+    try:
+        asyncio.run(_watch(roots, on_batch, debounce, poll_interval))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,20 @@
+import { mkdirSync, writeFileSync } from 'fs';
+import { fileURLToPath } from 'url';
+import { dirname, join } from 'path';
+
+import { generateFlowCalibrationCube } from '../src/utils/stlGenerator';
+
+// Writes the ASCII STL that `npm run check-stl` compares
+// scripts/generate-stl.py against. check-stl runs this first, so the
+// comparison always uses the current stlGenerator.ts and three.
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+
+const nozzleSize = 0.4;
+const out = join(__dirname, 'fixtures', `flow-calibration-cube-${nozzleSize}.stl`);
+
+generateFlowCalibrationCube({ nozzleSize }).text().then((stl) => {
+  mkdirSync(dirname(out), { recursive: true });
+  writeFileSync(out, stl);
+  console.log(`Wrote ${out}`);
+});
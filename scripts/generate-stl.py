@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""Batch-generate calibration models as binary STL.
+
+Builds the same geometry as src/utils/stlGenerator.ts, but as NumPy arrays:
+the flow calibration cube from its quads, and the retraction tower by
+clipping a template STL at the height OrcaSlicer uses. Binary STL is written
+straight from a structured array, with no per-triangle Python loop, and
+parameter sweeps are spread over a process pool.
+
+    python3 scripts/generate-stl.py flow-cube --nozzle 0.2 0.4 0.6 0.8 --out stl/
+    python3 scripts/generate-stl.py retraction-tower --template tower.stl \\
+        --start 0 --end 1 2 3 --step 0.1 0.2 --out stl/
+    python3 scripts/generate-stl.py flow-cube --nozzle 0.4 --compare FlowCalibrationCube.stl
+
+--compare checks the generated triangles against an ASCII STL exported by
+the TypeScript generator and exits 1 if they differ. ``npm run check-stl``
+first exports scripts/fixtures/flow-calibration-cube-0.4.stl from
+stlGenerator.ts (``npm run export-stl-fixture``, tsx + three), then runs
+it against that file.
+
+Requires NumPy (pip install numpy).
+"""
+import argparse
+import itertools
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    sys.exit('generate-stl.py needs NumPy: pip install numpy')
+
+# One binary STL record: normal, three vertices, attribute byte count
+STL_RECORD = np.dtype([('normal', '<f4', (3,)), ('vertices', '<f4', (3, 3)), ('attr', '<u2')])
+STL_HEADER_SIZE = 80
+
+_ASCII_FLOAT = r'([-+0-9.eE]+|NaN|-?Infinity)'
+_ASCII_NORMAL_RE = re.compile(rf'facet\s+normal\s+{_ASCII_FLOAT}\s+{_ASCII_FLOAT}\s+{_ASCII_FLOAT}')
+_ASCII_VERTEX_RE = re.compile(rf'vertex\s+{_ASCII_FLOAT}\s+{_ASCII_FLOAT}\s+{_ASCII_FLOAT}')
+
+
+def _quads_to_triangles(quads, normals):
+    """Split (n, 4, 3) quads into triangles (v1 v2 v3) and (v1 v3 v4), like addQuad"""
+    triangles = np.stack([quads[:, [0, 1, 2]], quads[:, [0, 2, 3]]], axis=1).reshape(-1, 3, 3)
+    return triangles, np.repeat(normals, 2, axis=0)
+
+
+def flow_calibration_cube(nozzle_size, cube_size=20.0, base_height=0.8,
+                          single_wall_height=8.0, double_wall_height=10.0):
+    """Triangles and normals of generateFlowCalibrationCube, in the same order"""
+    h = cube_size / 2
+    z0, z1 = 0.0, base_height
+    z2 = base_height + single_wall_height
+    z3 = base_height + single_wall_height + double_wall_height
+    thick = h - nozzle_size * 3
+    thin = h - nozzle_size
+
+    def ring(outer, inner, z):
+        # Front, back, left and right strips of a horizontal frame
+        return [
+            [[-outer, -outer, z], [outer, -outer, z], [inner, -inner, z], [-inner, -inner, z]],
+            [[-outer, outer, z], [-inner, inner, z], [inner, inner, z], [outer, outer, z]],
+            [[-outer, -outer, z], [-inner, -inner, z], [-inner, inner, z], [-outer, outer, z]],
+            [[inner, -inner, z], [outer, -outer, z], [outer, outer, z], [inner, inner, z]],
+        ]
+
+    def inner_walls(a, lo, hi):
+        return [
+            [[-a, -a, lo], [a, -a, lo], [a, -a, hi], [-a, -a, hi]],
+            [[-a, a, lo], [-a, a, hi], [a, a, hi], [a, a, lo]],
+            [[-a, -a, lo], [-a, -a, hi], [-a, a, hi], [-a, a, lo]],
+            [[a, -a, lo], [a, a, lo], [a, a, hi], [a, -a, hi]],
+        ]
+
+    up, inward = [0, 0, 1], [[0, 1, 0], [0, -1, 0], [1, 0, 0], [-1, 0, 0]]
+    quads = (
+        [[[-h, -h, z0], [-h, h, z0], [h, h, z0], [h, -h, z0]]]
+        + [[[-h, -h, z0], [h, -h, z0], [h, -h, z3], [-h, -h, z3]],
+           [[-h, h, z0], [-h, h, z3], [h, h, z3], [h, h, z0]],
+           [[-h, -h, z0], [-h, -h, z3], [-h, h, z3], [-h, h, z0]],
+           [[h, -h, z0], [h, h, z0], [h, h, z3], [h, -h, z3]]]
+        + ring(h, thick, z1)
+        + inner_walls(thick, z1, z2)
+        # The transition step's right strip is wound differently from ring()
+        + ring(thick, thin, z2)[:3]
+        + [[[thick, -thick, z2], [thick, thick, z2], [thin, thin, z2], [thin, -thin, z2]]]
+        + inner_walls(thin, z2, z3)
+        + ring(h, thin, z3)
+    )
+    normals = ([[0, 0, -1]] + [[0, -1, 0], [0, 1, 0], [-1, 0, 0], [1, 0, 0]]
+               + [up] * 4 + inward + [up] * 4 + inward + [up] * 4)
+    return _quads_to_triangles(np.asarray(quads, dtype=np.float32),
+                               np.asarray(normals, dtype=np.float32))
+
+
+def read_stl(path):
+    """Return (triangles, normals) from an ASCII or binary STL"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) >= STL_HEADER_SIZE + 4:
+        count = int.from_bytes(data[STL_HEADER_SIZE:STL_HEADER_SIZE + 4], 'little')
+        if len(data) == STL_HEADER_SIZE + 4 + count * STL_RECORD.itemsize:
+            records = np.frombuffer(data, STL_RECORD, count, STL_HEADER_SIZE + 4)
+            return records['vertices'].copy(), records['normal'].copy()
+
+    text = data.decode('ascii', errors='replace')
+    vertices = np.array(_ASCII_VERTEX_RE.findall(text), dtype=np.float32).reshape(-1, 3, 3)
+    normals = np.array(_ASCII_NORMAL_RE.findall(text), dtype=np.float32).reshape(-1, 3)
+    return vertices, normals
+
+
+def retraction_tower(template, start, end, step):
+    """Clip the template at OrcaSlicer's height 1.0 + (end - start) / step.
+
+    Same rule as filterSTLByHeight: a facet is kept only if every vertex
+    is at or below the cut (z is floored at 0, as in the TypeScript).
+    """
+    triangles, normals = template
+    max_height = 1.0 + (end - start) / step
+    keep = np.maximum(triangles[:, :, 2].max(axis=1), 0) <= max_height
+    return triangles[keep], normals[keep]
+
+
+def write_binary_stl(path, triangles, normals, name='Model'):
+    records = np.zeros(len(triangles), dtype=STL_RECORD)
+    records['vertices'] = triangles
+    records['normal'] = normals
+    header = f'binary STL {name}'.encode('ascii')[:STL_HEADER_SIZE].ljust(STL_HEADER_SIZE, b' ')
+    with open(path, 'wb') as f:
+        f.write(header)
+        f.write(np.uint32(len(records)).tobytes())
+        f.write(records.tobytes())
+
+
+# Retraction template loaded once per pool worker
+_template = None
+
+
+def _init_worker(template_path):
+    global _template
+    if template_path:
+        _template = read_stl(template_path)
+
+
+def _generate(job):
+    kind, params, path = job
+    if kind == 'flow-cube':
+        triangles, normals = flow_calibration_cube(**params)
+        name = 'FlowCalibrationCube'
+    else:
+        triangles, normals = retraction_tower(_template, **params)
+        name = 'RetractionTestTower'
+    write_binary_stl(path, triangles, normals, name)
+    return path, len(triangles)
+
+
+def _format(value):
+    return f'{value:g}'
+
+
+def build_jobs(args):
+    os.makedirs(args.out, exist_ok=True)
+    jobs = []
+    if args.model == 'flow-cube':
+        for nozzle, size in itertools.product(args.nozzle, args.cube_size):
+            params = {'nozzle_size': nozzle, 'cube_size': size}
+            name = f'flow-cube_nozzle-{_format(nozzle)}_size-{_format(size)}.stl'
+            jobs.append(('flow-cube', params, os.path.join(args.out, name)))
+    else:
+        for start, end, step in itertools.product(args.start, args.end, args.step):
+            params = {'start': start, 'end': end, 'step': step}
+            name = f'retraction-tower_{_format(start)}-{_format(end)}_step-{_format(step)}.stl'
+            jobs.append(('retraction-tower', params, os.path.join(args.out, name)))
+    return jobs
+
+
+def compare(args):
+    """Check generated geometry against an STL exported by the TypeScript code"""
+    expected, expected_normals = read_stl(args.compare)
+    if args.model == 'flow-cube':
+        actual, actual_normals = flow_calibration_cube(args.nozzle[0], args.cube_size[0])
+    else:
+        actual, actual_normals = retraction_tower(read_stl(args.template), args.start[0],
+                                                  args.end[0], args.step[0])
+    same = (actual.shape == expected.shape
+            and np.allclose(actual, expected, atol=1e-5)
+            and np.allclose(actual_normals, expected_normals, atol=1e-5))
+    print(f"{len(actual)} generated vs {len(expected)} expected triangles: "
+          f"{'match' if same else 'MISMATCH'}")
+    sys.exit(0 if same else 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Batch-generate calibration STLs')
+    parser.add_argument('model', choices=['flow-cube', 'retraction-tower'])
+    parser.add_argument('--nozzle', type=float, nargs='+', default=[0.4])
+    parser.add_argument('--cube-size', type=float, nargs='+', default=[20.0])
+    parser.add_argument('--template', help='retraction tower template STL (ASCII or binary)')
+    parser.add_argument('--start', type=float, nargs='+', default=[0.0])
+    parser.add_argument('--end', type=float, nargs='+', default=[2.0])
+    parser.add_argument('--step', type=float, nargs='+', default=[0.1])
+    parser.add_argument('--out', default='stl', help='output directory (default: stl)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='process pool size (default: CPU count)')
+    parser.add_argument('--compare', metavar='STL',
+                        help='compare the first parameter set with an STL from stlGenerator.ts')
+    args = parser.parse_args()
+
+    if args.model == 'retraction-tower' and not args.template:
+        parser.error('retraction-tower needs --template')
+    if args.compare:
+        compare(args)
+
+    jobs = build_jobs(args)
+    triangles = 0
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker,
+                             initargs=(args.template,)) as pool:
+        for path, count in pool.map(_generate, jobs, chunksize=max(1, len(jobs) // 64)):
+            triangles += count
+    print(f"Wrote {len(jobs)} {args.model} STLs ({triangles} triangles) to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Re-encode the mirrored doc images into size-capped WebP/AVIF variants.
+
+Every PNG/JPEG under public/docs/orca-slicer/images gets one variant, at
+most --width pixels wide, written next to it as
+``<name>-<ext>-<width>w.<format>`` (``foo.png`` -> ``foo-png-960w.webp``).
+Markdown has no srcset, so only the variant the docs link to is written.
+Encoding runs on a process pool and is cached by content hash, so unchanged
+images are never re-encoded.
+
+When an image is re-encoded (a new source, new dimensions or new settings),
+its previous variants are deleted and remembered in the manifest. Markdown
+references to the original or to any previous variant are then pointed at
+the current one with the same rewriter update-image-paths.py uses.
+
+Requires Pillow (pip install Pillow).
+"""
+import argparse
+import io
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from PIL import Image, features
+except ImportError:
+    sys.exit('optimize-images.py needs Pillow: pip install Pillow')
+
+from doc_cache import Manifest, file_record, fingerprint
+from doc_rewrite import iter_markdown_files, rewrite_tree
+
+IMAGES_ROOT = 'public/docs/orca-slicer/images'
+DOCS_ROOT = 'public/docs'
+
+SOURCE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+VARIANT_RE = re.compile(r'-\d+w\.(webp|avif)$')
+
+DEFAULT_WIDTH = 960
+MAX_QUALITY = 82
+MIN_QUALITY = 40
+QUALITY_STEP = 8
+
+
+def iter_source_images(root):
+    for directory, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if filename.lower().endswith(SOURCE_EXTENSIONS) and not VARIANT_RE.search(filename):
+                yield os.path.join(directory, filename)
+
+
+def variant_prefix(src):
+    """``foo.png`` -> ``foo-png``, so foo.png and foo.jpg never share a variant"""
+    stem, ext = os.path.splitext(src)
+    return f'{stem}-{ext[1:].lower()}'
+
+
+def existing_variants(src):
+    """Variant files already on disk next to ``src``, from any earlier run"""
+    directory = os.path.dirname(src)
+    filenames = sorted(os.listdir(directory))
+    prefixes = [os.path.basename(variant_prefix(src))]
+    # Older runs named variants without the extension; those can only be
+    # attributed when no other source in the directory has the same stem
+    stem = os.path.splitext(os.path.basename(src))[0]
+    if sum(os.path.splitext(name)[0] == stem and name.lower().endswith(SOURCE_EXTENSIONS)
+           for name in filenames) == 1:
+        prefixes.append(stem)
+    return [os.path.join(directory, filename) for filename in filenames
+            for prefix in prefixes
+            if filename.startswith(f'{prefix}-') and VARIANT_RE.fullmatch(filename[len(prefix):])]
+
+
+def encode_capped(image, fmt, max_bytes):
+    """Encode at the highest quality that fits max_bytes (or the lowest allowed)"""
+    quality = MAX_QUALITY
+    while True:
+        buffer = io.BytesIO()
+        options = {'quality': quality}
+        if fmt == 'WEBP':
+            options['method'] = 6
+        image.save(buffer, fmt, **options)
+        if buffer.tell() <= max_bytes or quality <= MIN_QUALITY:
+            return buffer.getvalue(), quality
+        quality = max(MIN_QUALITY, quality - QUALITY_STEP)
+
+
+def optimize_image(src, max_width, fmt, max_bytes):
+    """Write the variant of one image; return its description"""
+    with Image.open(src) as original:
+        image = original.convert('RGBA' if original.mode in ('RGBA', 'LA', 'P') else 'RGB')
+    width = min(max_width, image.width)
+    height = max(1, round(image.height * width / image.width))
+    resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+    data, quality = encode_capped(resized, fmt.upper(), max_bytes)
+    path = f'{variant_prefix(src)}-{width}w.{fmt}'
+    with open(path, 'wb') as f:
+        f.write(data)
+    return src, {'path': path, 'width': width, 'format': fmt, 'quality': quality, 'bytes': len(data)}
+
+
+def to_doc_path(path):
+    """Turn an on-disk image path into the ../images/... form used in the docs"""
+    return '../images/' + os.path.relpath(path, IMAGES_ROOT).replace(os.sep, '/')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Encode doc images into size-capped WebP/AVIF variants')
+    parser.add_argument('--width', type=int, default=DEFAULT_WIDTH,
+                        help=f'maximum variant width in pixels (default: {DEFAULT_WIDTH})')
+    parser.add_argument('--format', default='webp', choices=['webp', 'avif'])
+    parser.add_argument('--max-kb', type=int, default=200,
+                        help='target size cap per variant in KB')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='process pool size (default: CPU count)')
+    parser.add_argument('--force', action='store_true',
+                        help='re-encode every image, ignoring the .cache/ manifest')
+    parser.add_argument('--no-rewrite', action='store_true',
+                        help='only encode; leave the markdown references alone')
+    args = parser.parse_args()
+
+    if args.format == 'avif' and not features.check('avif'):
+        sys.exit('This Pillow build has no AVIF support; use --format webp')
+
+    settings = {'width': args.width, 'format': args.format, 'max_kb': args.max_kb,
+                'quality': [MAX_QUALITY, MIN_QUALITY, QUALITY_STEP], 'naming': 2}
+    manifest = Manifest('optimize-images', fingerprint(settings))
+    # Replaced variants are remembered across settings changes, so docs that
+    # still link to one can be re-pointed on any later run
+    history = Manifest('optimize-images-replaced', 1)
+    if args.force:
+        manifest.entries = {}
+
+    sources = list(iter_source_images(IMAGES_ROOT))
+    stale = [src for src in sources
+             if not manifest.is_fresh(src)
+             or not os.path.exists(manifest.entries[src]['variant']['path'])]
+
+    if stale:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            jobs = [pool.submit(optimize_image, src, args.width, args.format,
+                                args.max_kb * 1024) for src in stale]
+            for job in jobs:
+                src, variant = job.result()
+                replaced = set(history.entries.get(src, []))
+                for path in existing_variants(src):
+                    if path != variant['path']:
+                        os.unlink(path)
+                        replaced.add(to_doc_path(path))
+                replaced.discard(to_doc_path(variant['path']))
+                history.entries[src] = sorted(replaced)
+                manifest.record(src, dict(file_record(src), variant=variant))
+                print(f"Encoded: {src} -> {variant['path']}")
+    manifest.save()
+    history.save()
+    print(f"\n{len(sources)} images, {len(stale)} encoded, {len(sources) - len(stale)} unchanged since last run")
+
+    # Point each doc reference at the variant when it is smaller, and
+    # references to replaced variants at whatever the image is served as now
+    mappings = {}
+    smaller = original_bytes = optimized_bytes = 0
+    for src in sources:
+        variant = manifest.entries[src]['variant']
+        size = os.path.getsize(src)
+        target = to_doc_path(src)
+        if variant['bytes'] < size:
+            target = to_doc_path(variant['path'])
+            mappings[to_doc_path(src)] = target
+            smaller += 1
+            original_bytes += size
+            optimized_bytes += variant['bytes']
+        for old_path in history.entries.get(src, []):
+            mappings[old_path] = target
+
+    print(f"{smaller} images smaller as {args.format}: "
+          f"{original_bytes / 1e6:.2f} MB -> {optimized_bytes / 1e6:.2f} MB, "
+          f"{(original_bytes - optimized_bytes) / 1e6:.2f} MB saved")
+
+    if args.no_rewrite or not mappings:
+        return
+    results, _ = rewrite_tree(iter_markdown_files(DOCS_ROOT), mappings, args.workers)
+    for filepath, changed in results.items():
+        if changed:
+            print(f"Updated: {filepath}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,15 @@
 #!/usr/bin/env python3
+import argparse
+import json
 import os
-import re
+import time
+
+from doc_cache import Manifest, fingerprint
+from doc_links import discover_image_mappings, is_image_url, print_missing
+from doc_rewrite import MappingRewriter, iter_markdown_files, rewrite_file, rewrite_tree
+from doc_watch import DEFAULT_DEBOUNCE, backend, watch
+
+IMAGES_ROOT = 'public/docs/orca-slicer/images'
 
 # Define the image path mappings
 image_mappings = {
@@ -64,37 +73,170 @@ image_mappings = {
     'https://github.com/SoftFever/OrcaSlicer/raw/main/doc/images/vfa/vfa_test_print.jpg?raw=true': '../images/vfa/vfa_test_print.jpg',
 }
 
-def update_markdown_file(filepath):
+def update_markdown_file(filepath, rewriter=None, stream=False):
     """Update image URLs in a markdown file"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    original_content = content
-    
-    # Replace each image URL
-    for old_url, new_path in image_mappings.items():
-        # Escape special regex characters in URL
-        escaped_url = re.escape(old_url)
-        # Find and replace markdown image syntax
-        pattern = f'!\\[([^\\]]*)\\]\\({escaped_url}\\)'
-        replacement = f'![\\1]({new_path})'
-        content = re.sub(pattern, replacement, content)
-    
-    # Write back if changed
-    if content != original_content:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+    if rewriter is None:
+        rewriter = MappingRewriter(image_mappings)
+
+    if rewrite_file(filepath, rewriter, stream=stream):
         print(f"Updated: {filepath}")
     else:
         print(f"No changes needed: {filepath}")
 
+def discover_mappings(root):
+    """Extend image_mappings with every remote image linked from docs below root"""
+    filepaths = iter_markdown_files(root)
+    mappings, missing, count = discover_image_mappings(filepaths, IMAGES_ROOT, image_mappings)
+    added = len(mappings) - len(image_mappings)
+    print(f"Discovered {count} remote image links under {root}, {added} new mappings")
+    print_missing(missing)
+    return mappings
+
+def load_manifest(mappings, force=False):
+    """Open the rewrite cache; editing the mapping table invalidates it"""
+    manifest = Manifest('update-image-paths', fingerprint(list(mappings.items())))
+    if force:
+        manifest.entries = {}
+    return manifest
+
+def update_tree(root, mappings, workers=None, force=False, stream=False):
+    """Rewrite every markdown file below root on a process pool"""
+    manifest = load_manifest(mappings, force)
+    filepaths = list(iter_markdown_files(root))
+    stale = [filepath for filepath in filepaths if not manifest.is_fresh(filepath)]
+    results, stats = rewrite_tree(stale, mappings, workers, stream) if stale else ({}, {})
+
+    for filepath in stale:
+        manifest.record(filepath)
+        if results[filepath]:
+            print(f"Updated: {filepath}")
+    manifest.save()
+
+    changed = sum(results.values())
+    skipped = len(filepaths) - len(stale)
+    print(f"\n{len(filepaths)} files scanned, {changed} updated, {skipped} unchanged since last run")
+
+    if stats:
+        print("\nWorker throughput:")
+    for pid, worker in sorted(stats.items()):
+        seconds = worker['seconds']
+        rate = worker['bytes'] / seconds / 1e6 if seconds else 0.0
+        print(f"  pid {pid}: {worker['files']} files, {worker['bytes'] / 1e3:.1f} KB "
+              f"in {seconds:.3f}s ({rate:.1f} MB/s)")
+
+class TreeWatcher:
+    """Rewrite only the docs touched by each batch of file-system events"""
+
+    def __init__(self, root, mappings, workers=None, stream=False, discover=False, force=False):
+        self.root = root
+        self.mappings = mappings
+        self.workers = workers
+        self.stream = stream
+        self.discover = discover
+        self.manifest = load_manifest(mappings, force)
+        # Mirror image path -> docs whose remote link to it is not mapped yet
+        self.references = {}
+
+    def _discover(self, filepaths):
+        """Map newly mirrored images for filepaths and track the ones still missing"""
+        for docs in self.references.values():
+            docs.difference_update(filepaths)
+        mappings, missing, _ = discover_image_mappings(filepaths, IMAGES_ROOT, self.mappings)
+        if len(mappings) != len(self.mappings):
+            # New urls can only change docs linking to them, which are being
+            # rewritten now, so the other manifest entries stay valid
+            self.mappings = mappings
+            self.manifest.key = fingerprint(list(mappings.items()))
+        for image, docs in missing.docs_by_image(IMAGES_ROOT).items():
+            self.references.setdefault(image, set()).update(docs)
+
+    def rebuild(self, paths):
+        started = time.perf_counter()
+        stale = {path for path in paths
+                 if path.endswith('.md') and os.path.isfile(path) and not self.manifest.is_fresh(path)}
+        if self.discover:
+            images = [os.path.normpath(path) for path in paths if is_image_url(path)]
+            for image in images:
+                stale.update(doc for doc in self.references.pop(image, ()) if os.path.isfile(doc))
+            if stale:
+                self._discover(sorted(stale))
+        if not stale:
+            return
+
+        stale = sorted(stale)
+        results, _ = rewrite_tree(stale, self.mappings, self.workers, self.stream)
+        for filepath in stale:
+            self.manifest.record(filepath)
+            if results[filepath]:
+                print(f"Updated: {filepath}")
+        self.manifest.save()
+        print(f"Rebuilt {len(stale)} files ({sum(results.values())} updated) "
+              f"in {time.perf_counter() - started:.2f}s")
+
+    def run(self, debounce=DEFAULT_DEBOUNCE, poll_interval=None):
+        filepaths = list(iter_markdown_files(self.root))
+        if self.discover:
+            self._discover(filepaths)
+        # Catch up on anything that changed while nobody was watching
+        self.rebuild(filepaths)
+        print(f"Watching {self.root} ({backend(poll_interval)}), Ctrl-C to stop")
+        watch([self.root], self.rebuild, debounce, poll_interval)
+
 def main():
+    parser = argparse.ArgumentParser(description='Point remote OrcaSlicer image URLs at the local mirror')
+    parser.add_argument('--tree', nargs='?', const='public/docs', metavar='ROOT',
+                        help='rewrite every markdown file below ROOT (default: public/docs)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='process pool size for --tree (default: CPU count)')
+    parser.add_argument('--force', action='store_true',
+                        help='ignore the .cache/ manifest and re-check every file')
+    parser.add_argument('--stream', action='store_true',
+                        help='rewrite files in chunks instead of reading them into memory')
+    parser.add_argument('--discover', action='store_true',
+                        help='add mappings for every remote image linked from the docs')
+    parser.add_argument('--emit-mappings', metavar='PATH',
+                        help='write the mapping table in use as JSON to PATH')
+    parser.add_argument('--watch', action='store_true',
+                        help='keep running and rewrite docs below --tree as they change; '
+                             'with --discover, a newly mirrored image re-runs the docs linking to it')
+    parser.add_argument('--debounce', type=float, default=DEFAULT_DEBOUNCE,
+                        help='seconds of quiet before a batch of changes is rebuilt')
+    parser.add_argument('--poll', type=float, metavar='SECONDS',
+                        help='poll for changes instead of using watchdog')
+    args = parser.parse_args()
+
+    mappings = image_mappings
+    if args.discover:
+        mappings = discover_mappings(args.tree or 'public/docs')
+    if args.emit_mappings:
+        with open(args.emit_mappings, 'w', encoding='utf-8') as f:
+            json.dump(mappings, f, indent=2)
+            f.write('\n')
+        print(f"Wrote {len(mappings)} mappings to {args.emit_mappings}")
+
+    if args.watch:
+        watcher = TreeWatcher(args.tree or 'public/docs', mappings, args.workers,
+                              args.stream, args.discover, args.force)
+        watcher.run(args.debounce, args.poll)
+        return
+    if args.tree:
+        update_tree(args.tree, mappings, args.workers, args.force, args.stream)
+        return
+
     # Process all markdown files in the calibration directory
     calibration_dir = 'public/docs/orca-slicer/calibration'
+    manifest = load_manifest(mappings, args.force)
+    # Compile the mapping table once and reuse it for every file
+    rewriter = MappingRewriter(mappings)
     for filename in os.listdir(calibration_dir):
         if filename.endswith('.md'):
             filepath = os.path.join(calibration_dir, filename)
-            update_markdown_file(filepath)
+            if manifest.is_fresh(filepath):
+                print(f"Unchanged since last run: {filepath}")
+                continue
+            update_markdown_file(filepath, rewriter, args.stream)
+            manifest.record(filepath)
+    manifest.save()
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()